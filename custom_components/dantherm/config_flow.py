@@ -1,5 +1,6 @@
 """."""
 
+from functools import lru_cache
 import ipaddress
 import re
 
@@ -20,15 +21,20 @@ DATA_SCHEMA = vol.Schema(
     }
 )
 
+_HOSTNAME = re.compile(r"[a-zA-Z\d\-]+(?:\.[a-zA-Z\d\-]+)*")
 
-def host_valid(host):
+
+@lru_cache(maxsize=256)
+def host_valid(host: str) -> bool:
     """Return True if hostname or IP address is valid."""
-    try:
-        if ipaddress.ip_address(host).version == (4 or 6):
-            return True
-    except ValueError:
-        disallowed = re.compile(r"[^a-zA-Z\d\-]")
-        return all(x and not disallowed.search(x) for x in host.split("."))
+    if ":" in host:
+        try:
+            ipaddress.IPv6Address(host)
+        except ValueError:
+            return False
+        return True
+    # A dotted-quad IPv4 address is also a well-formed hostname.
+    return _HOSTNAME.fullmatch(host) is not None
 
 
 @callback
@@ -47,9 +53,10 @@ class DamthermConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def _host_in_configuration_exists(self, host) -> bool:
         """Return True if host exists in configuration."""
-        if host in dantherm_modbus_entries(self.hass):
-            return True
-        return False
+        return any(
+            entry.data[CONF_HOST] == host
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+        )
 
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
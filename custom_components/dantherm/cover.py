@@ -41,6 +41,9 @@ class DanthermCover(CoverEntity, DanthermEntity):
         self._device = device
         self._attr_has_entity_name = True
         self.entity_description: DanthermCoverEntityDescription = description
+        self._get_internal = self.internal_getter(description.data_getinternal)
+        self._get_icon = self.device_getter(f"get_{description.key}_icon")
+        self._set_internal = self.internal_setter(description.data_setinternal)
         self._attr_supported_features = 0
         if description.supported_features:
             self._attr_supported_features = description.supported_features
@@ -63,17 +66,15 @@ class DanthermCover(CoverEntity, DanthermEntity):
         """Return an icon."""
 
         result = super().icon
-        if hasattr(self._device, f"get_{self.key}_icon"):
-            result = getattr(self._device, f"get_{self.key}_icon")
+        if self._get_icon:
+            result = self._get_icon(self._device)
         return result
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open cover."""
 
-        if self.entity_description.data_setinternal:
-            await getattr(self._device, self.entity_description.data_setinternal)(
-                CoverEntityFeature.OPEN
-            )
+        if self._set_internal:
+            await self._set_internal(CoverEntityFeature.OPEN)
         else:
             await self._device.write_holding_registers(
                 description=self.entity_description,
@@ -83,10 +84,8 @@ class DanthermCover(CoverEntity, DanthermEntity):
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close cover."""
 
-        if self.entity_description.data_setinternal:
-            await getattr(self._device, self.entity_description.data_setinternal)(
-                CoverEntityFeature.CLOSE
-            )
+        if self._set_internal:
+            await self._set_internal(CoverEntityFeature.CLOSE)
         else:
             await self._device.write_holding_registers(
                 description=self.entity_description,
@@ -97,10 +96,8 @@ class DanthermCover(CoverEntity, DanthermEntity):
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop cover."""
 
-        if self.entity_description.data_setinternal:
-            await getattr(self._device, self.entity_description.data_setinternal)(
-                CoverEntityFeature.STOP
-            )
+        if self._set_internal:
+            await self._set_internal(CoverEntityFeature.STOP)
         else:
             await self._device.write_holding_registers(
                 description=self.entity_description,
@@ -117,8 +114,8 @@ class DanthermCover(CoverEntity, DanthermEntity):
     async def async_update(self) -> None:
         """Update the state of the cover."""
 
-        if self.entity_description.data_getinternal:
-            result = getattr(self._device, self.entity_description.data_getinternal)
+        if self._get_internal:
+            result = self._get_internal(self._device)
         else:
             result = await self._device.read_holding_registers(
                 description=self.entity_description
@@ -1,11 +1,14 @@
 """Device implementation."""
 
 import asyncio
+from collections.abc import Callable
 from datetime import datetime, timedelta
 import logging
+from operator import attrgetter
+import struct
 
 from pymodbus.constants import Endian
-from pymodbus.payload import BinaryPayloadBuilder, BinaryPayloadDecoder
+from pymodbus.payload import BinaryPayloadDecoder
 
 from homeassistant.components.cover import CoverEntityFeature
 from homeassistant.components.modbus import modbus
@@ -33,6 +36,36 @@ from .device_map import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of 16-bit holding registers occupied by each data class.
+REGISTER_COUNT = {
+    DataClass.Int8: 1,
+    DataClass.UInt8: 1,
+    DataClass.Int16: 1,
+    DataClass.UInt16: 1,
+    DataClass.Int32: 2,
+    DataClass.UInt32: 2,
+    DataClass.UInt64: 4,
+    DataClass.Float32: 2,
+}
+
+# Upper bound on the number of registers in a single modbus read request.
+MAX_READ_COUNT = 125
+
+# Big-endian layout of the value of each data class.
+STRUCTS = {
+    DataClass.Int8: struct.Struct(">b"),
+    DataClass.UInt8: struct.Struct(">B"),
+    DataClass.Int16: struct.Struct(">h"),
+    DataClass.UInt16: struct.Struct(">H"),
+    DataClass.Int32: struct.Struct(">i"),
+    DataClass.UInt32: struct.Struct(">I"),
+    DataClass.UInt64: struct.Struct(">Q"),
+    DataClass.Float32: struct.Struct(">f"),
+}
+
+# Big-endian layout of a run of registers, by register count.
+REGISTER_STRUCTS = {count: struct.Struct(f">{count}H") for count in (1, 2, 4)}
+
 
 class DanthermEntity(Entity):
     """Dantherm Entity."""
@@ -53,6 +86,24 @@ class DanthermEntity(Entity):
         """Unregister entity for refresh interval."""
         await self._device.async_remove_refresh_entity(self)
 
+    def device_getter(self, name: str) -> attrgetter | None:
+        """Return a getter for the named device property, if the device has one."""
+        if hasattr(type(self._device), name):
+            return attrgetter(name)
+        return None
+
+    def internal_getter(self, name: str | None) -> attrgetter | None:
+        """Return a getter for the named internal device property."""
+        if name:
+            return attrgetter(name)
+        return None
+
+    def internal_setter(self, name: str | None) -> Callable | None:
+        """Return the named internal device setter."""
+        if name:
+            return getattr(self._device, name)
+        return None
+
     def suspend_refresh(self, seconds: int):
         """Suspend entity refresh for specified number of seconds."""
         self.attr_suspend_refresh = datetime.now() + timedelta(seconds=seconds)
@@ -145,6 +196,8 @@ class Device:
         self._available = True
         self._read_errors = 0
         self._entities = []
+        self._read_plan: list[tuple[int, int]] | None = None
+        self._prefetched_registers: dict[int, int] = {}
         self.data = {}
 
     async def setup(self):
@@ -280,6 +333,7 @@ class Device:
 
         _LOGGER.debug("Adding refresh entity=%s", entity.name)
         self._entities.append(entity)
+        self._read_plan = None
 
     async def async_remove_refresh_entity(self, entity):
         """Remove entity for refresh."""
@@ -295,6 +349,7 @@ class Device:
 
         _LOGGER.debug("Removing refresh entity=%s", entity.name)
         self._entities.remove(entity)
+        self._read_plan = None
 
         if not self._entities:
             # This is the last entity, stop the interval timer
@@ -341,8 +396,67 @@ class Device:
         else:
             self._filter_remain = None
 
+        try:
+            await self._prefetch_registers()
+            for entity in self._entities:
+                await self.async_refresh_entity(entity)
+        finally:
+            self._prefetched_registers.clear()
+
+    def _build_read_plan(self) -> list[tuple[int, int]]:
+        """Group the entity registers into blocks of adjacent addresses."""
+
+        registers = set()
         for entity in self._entities:
-            await self.async_refresh_entity(entity)
+            description = entity.entity_description
+            if (
+                description.data_address is None
+                or getattr(description, "data_getinternal", None)
+                or getattr(description, "data_entity", None)
+            ):
+                continue
+            registers.add(
+                (description.data_address, REGISTER_COUNT[description.data_class])
+            )
+
+        blocks = []
+        for address, count in sorted(registers):
+            if blocks:
+                start, length, members = blocks[-1]
+                if start + length == address and length + count <= MAX_READ_COUNT:
+                    blocks[-1] = (start, length + count, members + 1)
+                    continue
+            blocks.append((address, count, 1))
+
+        # Registers read by a single entity are left to the entity itself.
+        return [(start, length) for start, length, members in blocks if members > 1]
+
+    async def _prefetch_registers(self) -> None:
+        """Read the register blocks of the read plan ahead of the entities."""
+
+        if self._read_plan is None:
+            self._read_plan = self._build_read_plan()
+            _LOGGER.debug("Read plan=%s", self._read_plan)
+
+        for block in list(self._read_plan):
+            address, count = block
+            # A failed block is not an error: its entities read their own
+            # registers, so it neither logs one nor counts towards availability.
+            result = await self._modbus.async_pb_call(
+                self._unit_id, address, count, "holding"
+            )
+            if result:
+                self._prefetched_registers.update(
+                    zip(range(address, address + count), result.registers)
+                )
+            else:
+                # Leave the block to its entities rather than retry it each cycle.
+                _LOGGER.debug(
+                    "Reading holding block register=%s count=%s failed",
+                    address,
+                    count,
+                )
+                self._read_plan.remove(block)
 
     async def async_refresh_entity(self, entity: DanthermEntity) -> None:
         """Refresh an entity."""
@@ -631,28 +745,16 @@ class Device:
         if description:
             if not address:
                 address = description.data_address
-            if description.data_class == DataClass.UInt8:
-                result = await self._read_holding_uint8(address)
-            elif description.data_class == DataClass.Int8:
-                result = await self._read_holding_int8(address)
-            elif description.data_class == DataClass.UInt16:
-                result = await self._read_holding_uint16(address)
-            elif description.data_class == DataClass.Int16:
-                result = await self._read_holding_int16(address)
-            elif description.data_class == DataClass.UInt32:
-                result = await self._read_holding_uint32(address)
-            elif description.data_class == DataClass.Int32:
-                result = await self._read_holding_int32(address)
-            elif description.data_class == DataClass.UInt64:
-                result = await self._read_holding_uint64(address)
-            elif description.data_class == DataClass.Float32:
+            if description.data_class == DataClass.Float32:
                 if not precision:
                     precision = description.data_precision
                 result = await self._read_holding_float32(address, precision)
+            else:
+                result = await self._read_holding(address, description.data_class)
         elif address:
             data = await self._read_holding_registers(address, count)
             decoder = BinaryPayloadDecoder.fromRegisters(
-                data.registers,
+                data,
                 byteorder or Endian.LITTLE,
                 wordorder or Endian.LITTLE,
             )
@@ -687,20 +789,7 @@ class Device:
                 address = description.data_setaddress
             if not address:
                 address = description.data_address
-            if data_class == DataClass.UInt8:
-                await self._write_holding_uint8(address, value)
-            elif data_class == DataClass.Int8:
-                await self._write_holding_int8(address, value)
-            elif data_class == DataClass.UInt16:
-                await self._write_holding_uint16(address, value)
-            elif data_class == DataClass.Int16:
-                await self._write_holding_int16(address, value)
-            elif data_class == DataClass.UInt32:
-                await self._write_holding_uint32(address, value)
-            elif data_class == DataClass.Int32:
-                await self._write_holding_int32(address, value)
-            elif data_class == DataClass.Float32:
-                await self._write_holding_float32(address, value)
+            await self._write_holding(address, data_class, value)
         else:
             await self._write_holding_registers(address, value)
 
@@ -732,183 +821,106 @@ class Device:
         """Device serial number."""
         return self._device_serial_number
 
-    async def _read_holding_registers(self, address, count):
+    async def _read_holding_registers(self, address, count) -> list[int] | None:
         """Read holding registers."""
 
+        if self._prefetched_registers:
+            registers = [
+                self._prefetched_registers.get(address + offset)
+                for offset in range(count)
+            ]
+            if None not in registers:
+                return registers
+
         result = await self._modbus.async_pb_call(
             self._unit_id, address, count, "holding"
         )
         if result:
             self._available = True
             self._read_errors = 0
-        else:
-            self._read_errors += 1
-            if self._read_errors > 3:
-                self._available = False
-            _LOGGER.error(
-                "Error reading holding register=%s count=%s", str(address), str(count)
-            )
-        return result
+            return result.registers
+
+        self._read_errors += 1
+        if self._read_errors > 3:
+            self._available = False
+        _LOGGER.error(
+            "Error reading holding register=%s count=%s", str(address), str(count)
+        )
+        return None
 
     async def _write_holding_registers(self, address, values: list[int] | int):
         """Write holding registers."""
 
+        # Don't let a refresh in progress pick up values from before the write,
+        # including those of a block read that completes while it is queued.
+        self._prefetched_registers.clear()
+
         result = await self._modbus.async_pb_call(
             self._unit_id,
             address,
             values,
             "write_registers",
         )
+        self._prefetched_registers.clear()
         if result is None:
             _LOGGER.error(
                 "Error writing holding register=%s values=%s", str(address), str(values)
             )
 
-    async def _read_holding_int8(self, address):
-        """Read holding int8 registers."""
+    async def _read_holding(self, address, data_class: DataClass):
+        """Read and decode holding registers of the given data class."""
 
-        result = await self._read_holding_registers(address, 1)
+        count = REGISTER_COUNT[data_class]
+        result = await self._read_holding_registers(address, count)
         if result:
-            decoder = BinaryPayloadDecoder.fromRegisters(
-                result.registers, byteorder=Endian.BIG, wordorder=Endian.LITTLE
-            )
-            return decoder.decode_8bit_int()
+            # The unit sends the least significant register first.
+            payload = REGISTER_STRUCTS[count].pack(*reversed(result))
+            return STRUCTS[data_class].unpack_from(payload)[0]
         return None
 
-    async def _write_holding_int8(self, address, value):
-        """Write holding int8 registers."""
+    async def _write_holding(self, address, data_class: DataClass, value):
+        """Encode and write holding registers of the given data class."""
 
-        builder = BinaryPayloadBuilder(byteorder=Endian.BIG, wordorder=Endian.LITTLE)
-        builder.add_8bit_int(value)
-        payload = builder.to_registers()
-        await self._write_holding_registers(address, payload)
+        count = REGISTER_COUNT[data_class]
+        if data_class != DataClass.Float32:
+            # Home Assistant passes number values as floats.
+            value = int(value)
+        payload = STRUCTS[data_class].pack(value).ljust(count * 2, b"\x00")
+        registers = REGISTER_STRUCTS[count].unpack(payload)
+        await self._write_holding_registers(address, list(reversed(registers)))
 
     async def _read_holding_uint8(self, address):
         """Read holding uint8 registers."""
 
-        result = await self._read_holding_registers(address, 1)
-        if result:
-            decoder = BinaryPayloadDecoder.fromRegisters(
-                result.registers, byteorder=Endian.BIG, wordorder=Endian.LITTLE
-            )
-            return decoder.decode_8bit_uint()
-        return None
-
-    async def _write_holding_uint8(self, address, value):
-        """Write holding uint8 registers."""
-
-        builder = BinaryPayloadBuilder(byteorder=Endian.BIG, wordorder=Endian.LITTLE)
-        builder.add_8bit_uint(value)
-        payload = builder.to_registers()
-        await self._write_holding_registers(address, payload)
-
-    async def _read_holding_int16(self, address):
-        """Read holding int16 registers."""
-
-        result = await self._read_holding_registers(address, 1)
-        if result:
-            decoder = BinaryPayloadDecoder.fromRegisters(
-                result.registers, byteorder=Endian.BIG, wordorder=Endian.LITTLE
-            )
-            return decoder.decode_16bit_int()
-        return None
-
-    async def _write_holding_int16(self, address, value):
-        """Write holding int16 registers."""
-
-        builder = BinaryPayloadBuilder(byteorder=Endian.BIG, wordorder=Endian.LITTLE)
-        builder.add_16bit_int(value)
-        payload = builder.to_registers()
-        await self._write_holding_registers(address, payload)
-
-    async def _read_holding_uint16(self, address):
-        """Read holding uint16 registers."""
-
-        result = await self._read_holding_registers(address, 1)
-        if result:
-            decoder = BinaryPayloadDecoder.fromRegisters(
-                result.registers, byteorder=Endian.BIG, wordorder=Endian.LITTLE
-            )
-            return decoder.decode_16bit_uint()
-        return None
-
-    async def _write_holding_uint16(self, address, value):
-        """Write holding uint16 registers."""
-
-        builder = BinaryPayloadBuilder(byteorder=Endian.BIG, wordorder=Endian.LITTLE)
-        builder.add_16bit_uint(value)
-        payload = builder.to_registers()
-        await self._write_holding_registers(address, payload)
+        return await self._read_holding(address, DataClass.UInt8)
 
     async def _read_holding_int32(self, address):
         """Read holding int32 registers."""
 
-        result = await self._read_holding_registers(address, 2)
-        if result:
-            decoder = BinaryPayloadDecoder.fromRegisters(
-                result.registers, byteorder=Endian.BIG, wordorder=Endian.LITTLE
-            )
-            return decoder.decode_32bit_int()
-        return None
-
-    async def _write_holding_int32(self, address, value):
-        """Write holding int32 registers."""
-
-        builder = BinaryPayloadBuilder(byteorder=Endian.BIG, wordorder=Endian.LITTLE)
-        builder.add_32bit_int(value)
-        payload = builder.to_registers()
-        await self._write_holding_registers(address, payload)
+        return await self._read_holding(address, DataClass.Int32)
 
     async def _read_holding_uint32(self, address):
         """Read holding uint32 registers."""
 
-        result = await self._read_holding_registers(address, 2)
-        if result:
-            decoder = BinaryPayloadDecoder.fromRegisters(
-                result.registers, byteorder=Endian.BIG, wordorder=Endian.LITTLE
-            )
-            return decoder.decode_32bit_uint()
-        return None
+        return await self._read_holding(address, DataClass.UInt32)
 
     async def _write_holding_uint32(self, address, value):
         """Write holding uint32 registers."""
 
-        builder = BinaryPayloadBuilder(byteorder=Endian.BIG, wordorder=Endian.LITTLE)
-        builder.add_32bit_uint(int(value))
-        payload = builder.to_registers()
-        await self._write_holding_registers(address, payload)
+        await self._write_holding(address, DataClass.UInt32, value)
 
     async def _read_holding_uint64(self, address):
         """Read holding uint64 registers."""
 
-        result = await self._read_holding_registers(address, 4)
-        if result:
-            decoder = BinaryPayloadDecoder.fromRegisters(
-                result.registers, byteorder=Endian.BIG, wordorder=Endian.LITTLE
-            )
-            return decoder.decode_64bit_uint()
-        return None
+        return await self._read_holding(address, DataClass.UInt64)
 
     async def _read_holding_float32(self, address, precision):
         """Read holding float32 registers."""
 
-        result = await self._read_holding_registers(address, 2)
-        if result:
-            decoder = BinaryPayloadDecoder.fromRegisters(
-                result.registers, byteorder=Endian.BIG, wordorder=Endian.LITTLE
-            )
-            result = decoder.decode_32bit_float()
+        result = await self._read_holding(address, DataClass.Float32)
+        if result is not None:
             if precision >= 0:
                 result = round(result, precision)
             if precision == 0:
                 result = int(result)
-            return result
-        return None
-
-    async def _write_holding_float32(self, address, value):
-        """Write holding float32 registers."""
-
-        builder = BinaryPayloadBuilder(byteorder=Endian.BIG, wordorder=Endian.LITTLE)
-        builder.add_32bit_float(value)
-        payload = builder.to_registers()
-        await self._write_holding_registers(address, payload)
+        return result
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Final
+from typing import Final
 
 from homeassistant.components.button import ButtonEntityDescription
 from homeassistant.components.cover import (
@@ -136,7 +136,7 @@ class DanthermButtonEntityDescription(ButtonEntityDescription):
     state_entity: str | None = None
 
     data_address: int | None = None
-    data_exclude_if: Any | None = None
+    data_exclude_if: int | None = None
     data_exclude_if_above: int | None = None
     data_exclude_if_below: int | None = None
     data_class: DataClass = DataClass.UInt16
@@ -159,7 +159,7 @@ class DanthermCoverEntityDescription(CoverEntityDescription):
     data_address: int | None = None
     data_getinternal: str | None = None
     data_entity: str | None = None
-    data_exclude_if: Any | None = None
+    data_exclude_if: int | None = None
     data_exclude_if_above: int | None = None
     data_exclude_if_below: int | None = None
     data_class: DataClass = DataClass.UInt16
@@ -183,7 +183,7 @@ class DanthermNumberEntityDescription(NumberEntityDescription):
     data_getinternal: str | None = None
     data_precision: int | None = None
     data_entity: str | None = None
-    data_exclude_if: Any | None = None
+    data_exclude_if: int | None = None
     data_exclude_if_above: int | None = None
     data_exclude_if_below: int | None = None
     data_class: DataClass = DataClass.UInt16
@@ -203,7 +203,7 @@ class DanthermSelectEntityDescription(SelectEntityDescription):
     data_getinternal: str | None = None
     data_entity: str | None = None
     data_bitwise_and: int | None = None
-    data_exclude_if: Any | None = None
+    data_exclude_if: int | None = None
     data_exclude_if_above: int | None = None
     data_exclude_if_below: int | None = None
     data_class: DataClass = DataClass.UInt16
@@ -220,7 +220,7 @@ class DanthermSensorEntityDescription(SensorEntityDescription):
     data_getinternal: str | None = None
     data_precision: int | None = None
     data_scale: int | None = None
-    data_exclude_if: Any | None = None
+    data_exclude_if: int | None = None
     data_exclude_if_above: int | None = None
     data_exclude_if_below: int | None = None
     data_entity: str | None = None
@@ -248,7 +248,7 @@ class DanthermSwitchEntityDescription(SwitchEntityDescription):
 
     data_address: int | None = None
     data_entity: str | None = None
-    data_exclude_if: Any | None = None
+    data_exclude_if: int | None = None
     data_exclude_if_above: int | None = None
     data_exclude_if_below: int | None = None
     data_class: DataClass = DataClass.UInt16
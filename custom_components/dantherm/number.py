@@ -39,6 +39,9 @@ class DanthermNumber(NumberEntity, DanthermEntity):
         self._device = device
         self._attr_has_entity_name = True
         self.entity_description: DanthermNumberEntityDescription = description
+        self._get_internal = self.internal_getter(description.data_getinternal)
+        self._get_attrs = self.device_getter(f"get_{description.key}_attrs")
+        self._set_internal = self.internal_setter(description.data_setinternal)
 
     @property
     def native_value(self):
@@ -49,8 +52,8 @@ class DanthermNumber(NumberEntity, DanthermEntity):
     async def async_set_native_value(self, value: int) -> None:
         """Update the current value."""
 
-        if self.entity_description.data_setinternal:
-            await getattr(self._device, self.entity_description.data_setinternal)(value)
+        if self._set_internal:
+            await self._set_internal(value)
         else:
             await self._device.write_holding_registers(
                 description=self.entity_description, value=value
@@ -59,13 +62,11 @@ class DanthermNumber(NumberEntity, DanthermEntity):
     async def async_update(self) -> None:
         """Update the state of the number."""
 
-        if hasattr(self._device, f"get_{self.key}_attrs"):
-            self._attr_extra_state_attributes = getattr(
-                self._device, f"{self.key}_attrs"
-            )
+        if self._get_attrs:
+            self._attr_extra_state_attributes = self._get_attrs(self._device)
 
-        if self.entity_description.data_getinternal:
-            result = getattr(self._device, self.entity_description.data_getinternal)
+        if self._get_internal:
+            result = self._get_internal(self._device)
         else:
             result = await self._device.read_holding_registers(
                 description=self.entity_description
@@ -39,23 +39,24 @@ class DanthermSelect(SelectEntity, DanthermEntity):
         self._device = device
         self._attr_has_entity_name = True
         self.entity_description: DanthermSelectEntityDescription = description
+        self._get_internal = self.internal_getter(description.data_getinternal)
+        self._get_icon = self.device_getter(f"get_{description.key}_icon")
+        self._set_internal = self.internal_setter(description.data_setinternal)
 
     @property
     def icon(self) -> str | None:
         """Return an icon."""
 
         result = super().icon
-        if hasattr(self._device, f"get_{self.key}_icon"):
-            result = getattr(self._device, f"get_{self.key}_icon")
+        if self._get_icon:
+            result = self._get_icon(self._device)
         return result
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
 
-        if self.entity_description.data_setinternal:
-            await getattr(self._device, self.entity_description.data_setinternal)(
-                option
-            )
+        if self._set_internal:
+            await self._set_internal(option)
         else:
             await self._device.write_holding_registers(
                 description=self.entity_description, value=int(option)
@@ -64,8 +65,8 @@ class DanthermSelect(SelectEntity, DanthermEntity):
     async def async_update(self) -> None:
         """Update state of the select."""
 
-        if self.entity_description.data_getinternal:
-            result = getattr(self._device, self.entity_description.data_getinternal)
+        if self._get_internal:
+            result = self._get_internal(self._device)
         elif self.entity_description.data_entity:
             result = self._device.data.get(self.entity_description.data_entity, None)
         else:
@@ -39,6 +39,9 @@ class DanthermSensor(SensorEntity, DanthermEntity):
         self._device = device
         self._attr_has_entity_name = True
         self.entity_description: DanthermSensorEntityDescription = description
+        self._get_internal = self.internal_getter(description.data_getinternal)
+        self._get_icon = self.device_getter(f"get_{description.key}_icon")
+        self._get_attrs = self.device_getter(f"get_{description.key}_attrs")
 
     @property
     def native_value(self):
@@ -51,8 +54,8 @@ class DanthermSensor(SensorEntity, DanthermEntity):
         """Return an icon."""
 
         result = super().icon
-        if hasattr(self._device, f"get_{self.key}_icon"):
-            result = getattr(self._device, f"get_{self.key}_icon")
+        if self._get_icon:
+            result = self._get_icon(self._device)
         elif self.entity_description.icon_zero and not self.native_value:
             result = self.entity_description.icon_zero
 
@@ -61,13 +64,11 @@ class DanthermSensor(SensorEntity, DanthermEntity):
     async def async_update(self) -> None:
         """Update the state of the sensor."""
 
-        if hasattr(self._device, f"get_{self.key}_attrs"):
-            self._attr_extra_state_attributes = getattr(
-                self._device, f"get_{self.key}_attrs"
-            )
+        if self._get_attrs:
+            self._attr_extra_state_attributes = self._get_attrs(self._device)
 
-        if self.entity_description.data_getinternal:
-            result = getattr(self._device, self.entity_description.data_getinternal)
+        if self._get_internal:
+            result = self._get_internal(self._device)
         elif self.entity_description.data_entity:
             result = self._device.data.get(self.entity_description.data_entity, None)
         else:
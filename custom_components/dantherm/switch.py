@@ -40,6 +40,8 @@ class DanthermSwitch(SwitchEntity, DanthermEntity):
         self._device = device
         self._attr_has_entity_name = True
         self.entity_description: DanthermSwitchEntityDescription = description
+        self._get_internal = self.internal_getter(description.data_getinternal)
+        self._set_internal = self.internal_setter(description.data_setinternal)
 
     @property
     def icon(self) -> str | None:
@@ -59,8 +61,8 @@ class DanthermSwitch(SwitchEntity, DanthermEntity):
         state = self.entity_description.state_setoff
         if state is None:
             state = self.entity_description.state_off
-        if self.entity_description.data_setinternal:
-            await getattr(self._device, self.entity_description.data_setinternal)(state)
+        if self._set_internal:
+            await self._set_internal(state)
         else:
             await self._device.write_holding_registers(
                 description=self.entity_description, value=state
@@ -76,8 +78,8 @@ class DanthermSwitch(SwitchEntity, DanthermEntity):
         state = self.entity_description.state_seton
         if state is None:
             state = self.entity_description.state_on
-        if self.entity_description.data_setinternal:
-            await getattr(self._device, self.entity_description.data_setinternal)(state)
+        if self._set_internal:
+            await self._set_internal(state)
         else:
             await self._device.write_holding_registers(
                 description=self.entity_description, value=state
@@ -91,8 +93,8 @@ class DanthermSwitch(SwitchEntity, DanthermEntity):
                 _LOGGER.debug("Skipping suspened entity=%s", self.name)
                 return
 
-        if self.entity_description.data_getinternal:
-            result = getattr(self._device, self.entity_description.data_getinternal)
+        if self._get_internal:
+            result = self._get_internal(self._device)
         elif self.entity_description.data_entity:
             result = self._device.data.get(self.entity_description.data_entity, None)
         else:
@@ -0,0 +1,192 @@
+"""Tests for the Dantherm device."""
+
+from collections.abc import Iterator
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.dantherm.device import MAX_READ_COUNT, Device  # noqa: E402
+from custom_components.dantherm.device_map import (  # noqa: E402
+    NUMBERS,
+    SENSORS,
+    DanthermSensorEntityDescription,
+    DataClass,
+)
+
+
+@pytest.fixture
+def device() -> Iterator[Device]:
+    """Return a device with a mocked modbus hub."""
+    with patch("custom_components.dantherm.device.modbus.ModbusHub") as hub, patch(
+        "custom_components.dantherm.device.async_track_time_interval"
+    ):
+        hub.return_value.async_pb_call = AsyncMock(side_effect=_pb_call)
+        yield Device(MagicMock(), "Dantherm", "127.0.0.1", 502, 1, 10)
+
+
+async def _pb_call(unit_id, address, value, use_call):
+    """Answer reads with the register addresses and accept every write."""
+    if use_call == "holding":
+        return SimpleNamespace(registers=list(range(address, address + value)))
+    return SimpleNamespace()
+
+
+def _entity(description) -> MagicMock:
+    """Return a refreshable entity for the description."""
+    entity = MagicMock()
+    entity.entity_description = description
+    entity.key = description.key
+    entity.attr_suspend_refresh = None
+    entity.async_update_ha_state = AsyncMock()
+    return entity
+
+
+def _sensor(address, data_class=DataClass.UInt16, **kwargs):
+    """Return a sensor description reading the given address."""
+    return DanthermSensorEntityDescription(
+        key=f"sensor_{address}", data_address=address, data_class=data_class, **kwargs
+    )
+
+
+async def _add_entities(device, descriptions):
+    """Add refresh entities for the descriptions to the device."""
+    for description in descriptions:
+        await device.async_add_refresh_entity(_entity(description))
+
+
+async def test_write_float_to_uint32_description(device):
+    """Number entities write floats, which must be sent as integers."""
+    description = next(
+        description
+        for description in NUMBERS
+        if description.key == "manual_bypass_duration"
+    )
+
+    await device.write_holding_registers(description=description, value=60.0)
+
+    device._modbus.async_pb_call.assert_awaited_once_with(
+        1, 264, [60, 0], "write_registers"
+    )
+
+
+@pytest.mark.parametrize(
+    ("data_class", "registers"),
+    [
+        (DataClass.Int8, [0x0700]),
+        (DataClass.UInt8, [0x0700]),
+        (DataClass.Int16, [7]),
+        (DataClass.UInt16, [7]),
+        (DataClass.Int32, [7, 0]),
+        (DataClass.UInt32, [7, 0]),
+        (DataClass.UInt64, [7, 0, 0, 0]),
+        (DataClass.Float32, [0, 0x40E0]),
+    ],
+)
+async def test_write_float_per_data_class(device, data_class, registers):
+    """Every data class accepts the float values Home Assistant passes."""
+    await device._write_holding(10, data_class, 7.0)
+
+    device._modbus.async_pb_call.assert_awaited_once_with(
+        1, 10, registers, "write_registers"
+    )
+
+
+async def test_read_plan_merges_adjacent_registers(device):
+    """The fan speeds and temperatures are read as one block each."""
+    await _add_entities(device, SENSORS)
+
+    assert device._build_read_plan() == [(100, 4), (132, 10)]
+
+
+async def test_read_plan_leaves_out_single_registers(device):
+    """A register read by a single entity gets no block of its own."""
+    await _add_entities(device, [_sensor(10), _sensor(20), _sensor(21)])
+
+    assert device._build_read_plan() == [(20, 2)]
+
+
+async def test_read_plan_is_capped(device):
+    """A block never exceeds the modbus read limit."""
+    await _add_entities(
+        device, [_sensor(address, DataClass.Float32) for address in range(0, 140, 2)]
+    )
+
+    plan = device._build_read_plan()
+
+    assert plan == [(0, 124), (124, 16)]
+    assert all(count <= MAX_READ_COUNT for _, count in plan)
+
+
+async def test_read_plan_skips_internal_and_derived_entities(device):
+    """Entities that don't read their own register are not planned."""
+    await _add_entities(
+        device,
+        [
+            _sensor(10),
+            _sensor(11),
+            _sensor(12, data_getinternal="get_alarm"),
+            _sensor(13, data_entity="sensor_10"),
+        ],
+    )
+
+    assert device._build_read_plan() == [(10, 2)]
+
+
+async def test_partially_prefetched_read_goes_to_the_unit(device):
+    """A read only partly covered by a block is read live."""
+    await _add_entities(device, [_sensor(100), _sensor(101)])
+    await device._prefetch_registers()
+    device._modbus.async_pb_call.reset_mock()
+
+    assert await device._read_holding_registers(100, 2) == [100, 101]
+    device._modbus.async_pb_call.assert_not_awaited()
+
+    assert await device._read_holding_registers(101, 2) == [101, 102]
+    device._modbus.async_pb_call.assert_awaited_once_with(1, 101, 2, "holding")
+
+
+async def test_prefetched_registers_cleared_after_cycle(device):
+    """Prefetched values serve the cycle and are dropped at its end."""
+    await _add_entities(device, [_sensor(100), _sensor(101)])
+    seen = []
+    for entity in device._entities:
+        entity.async_update_ha_state.side_effect = lambda _: seen.append(
+            dict(device._prefetched_registers)
+        )
+
+    await device.async_refresh_entities()
+
+    assert seen == [{100: 100, 101: 101}] * 2
+    assert device._prefetched_registers == {}
+
+
+async def test_prefetched_registers_cleared_after_write(device):
+    """A block read completing during a write does not outlive it."""
+    await _add_entities(device, [_sensor(100), _sensor(101)])
+
+    async def _pb_call_during_read(unit_id, address, value, use_call):
+        device._prefetched_registers.update({100: 100, 101: 101})
+        return SimpleNamespace()
+
+    device._modbus.async_pb_call.side_effect = _pb_call_during_read
+
+    await device._write_holding_registers(100, [1])
+
+    assert device._prefetched_registers == {}
+
+
+async def test_failed_block_is_dropped(device, caplog):
+    """A failing block is left to its entities without an error."""
+    await _add_entities(device, [_sensor(100), _sensor(101)])
+    device._modbus.async_pb_call.side_effect = None
+    device._modbus.async_pb_call.return_value = None
+
+    for _ in range(5):
+        await device._prefetch_registers()
+
+    device._modbus.async_pb_call.assert_awaited_once_with(1, 100, 2, "holding")
+    assert device._read_plan == []
+    assert not [record for record in caplog.records if record.levelname == "ERROR"]